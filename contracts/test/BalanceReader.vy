@@ -0,0 +1,19 @@
+# @version 0.4.0
+
+"""
+@title Balance Reader
+@notice Read several token balances in a single call for testing
+"""
+
+from ethereum.ercs import IERC20
+
+MAX_USERS: constant(uint256) = 16
+
+
+@external
+@view
+def balances(token: IERC20, users: DynArray[address, MAX_USERS]) -> DynArray[uint256, MAX_USERS]:
+    result: DynArray[uint256, MAX_USERS] = []
+    for user: address in users:
+        result.append(staticcall token.balanceOf(user))
+    return result
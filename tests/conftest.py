@@ -90,6 +90,10 @@ def env(fork_mode):
     """Set up the boa environment based on fork mode"""
     if fork_mode:
         boa.fork(FORK_RPC_URI)
+    else:
+        # Fast mode patches py-evm's account state object and short-circuits
+        # contract calls; neither is safe against forked state
+        boa.env.enable_fast_mode()
     return boa.env
 
 
@@ -115,14 +119,19 @@ def ipfs_hash():
 
 
 @pytest.fixture(scope="session")
-def weth(env, fork_mode):
+def erc20_contract():
+    """Cache the test token bytecode"""
+    return boa.load_partial("contracts/test/ERC20.vy")
+
+
+@pytest.fixture(scope="session")
+def weth(env, fork_mode, erc20_contract):
     """Get WETH contract interface with deposit functionality"""
     if fork_mode:
         weth_contract = boa.load_partial("contracts/test/IWETH.vy")
         return weth_contract.at(WETH_ADDR)
     else:
-        token = boa.load_partial("contracts/test/ERC20.vy")
-        return token.deploy("Test WETH", "WETH", 18)
+        return erc20_contract.deploy("Test WETH", "WETH", 18)
 
 
 @pytest.fixture(scope="session")
@@ -177,12 +186,11 @@ def charlie(make_user):
 
 
 @pytest.fixture(scope="session")
-def payment_token(env, fork_mode):
-    token = boa.load_partial("contracts/test/ERC20.vy")
+def payment_token(env, fork_mode, erc20_contract):
     if fork_mode:
-        return token.at(TEST_TOKEN_ADDR)
+        return erc20_contract.at(TEST_TOKEN_ADDR)
     else:
-        return token.deploy("Test Token", "TEST", 18)
+        return erc20_contract.deploy("Test Token", "TEST", 18)
 
 
 @pytest.fixture(scope="session")
@@ -237,6 +245,14 @@ def auction_house_with_auction(auction_house, deployer, ipfs_hash):
     return auction_house
 
 
+@pytest.fixture
+def approve_all(payment_token, auction_house, alice, bob, charlie):
+    """Give the auction house an unlimited allowance from every bidder"""
+    for user in (alice, bob, charlie):
+        with boa.env.prank(user):
+            payment_token.approve(auction_house.address, 2**256 - 1)
+
+
 @pytest.fixture
 def auction_house_with_multiple_auctions(auction_house, deployer):
     """Setup multiple auctions"""
@@ -260,21 +276,27 @@ def inert_weth_trader():
 
 # A token, but not WETH compatible (ie deposit)
 @pytest.fixture(scope="session")
-def inert_weth():
-    token = boa.load_partial("contracts/test/ERC20.vy")
-    return token.deploy("Inert Wrapped Ether", "WETH", 18)
+def inert_weth(erc20_contract):
+    return erc20_contract.deploy("Inert Wrapped Ether", "WETH", 18)
+
+
+@pytest.fixture(scope="session")
+def zap_contract():
+    """Cache the zap bytecode"""
+    return boa.load_partial("contracts/AuctionZap.vy")
 
 
 @pytest.fixture(scope="session")
-def weth_trader(payment_token, weth, trading_pool, pool_indices, directory, deployer):
+def weth_trader(payment_token, weth, trading_pool, pool_indices, directory, deployer, zap_contract):
     weth_index = pool_indices[0]
     squid_index = pool_indices[1]
     assert trading_pool.coins(squid_index) == payment_token.address
     assert trading_pool.coins(weth_index) == weth.address
 
-    contract = boa.load_partial("contracts/AuctionZap.vy")
     with boa.env.prank(deployer):
-        deployment = contract.deploy(payment_token, weth, trading_pool, [weth_index, squid_index])
+        deployment = zap_contract.deploy(
+            payment_token, weth, trading_pool, [weth_index, squid_index]
+        )
         deployment.set_approved_directory(directory)
         directory.add_token_support(weth, deployment)
     return deployment
@@ -285,6 +307,27 @@ def auction_house_with_weth(auction_house_with_auction, weth_trader):
     return auction_house_with_auction
 
 
+@pytest.fixture(scope="session")
+def min_next_bid(default_min_bid_increment, precision):
+    """Lowest bid that outbids `amount` under the default increment"""
+
+    def _min_next_bid(amount):
+        return amount + amount * default_min_bid_increment // precision
+
+    return _min_next_bid
+
+
+@pytest.fixture(scope="session")
+def split_fee(default_fee, precision):
+    """Split `amount` into the default fee and the remainder"""
+
+    def _split_fee(amount):
+        fee = amount * default_fee // precision
+        return fee, amount - fee
+
+    return _split_fee
+
+
 @pytest.fixture(scope="session")
 def approval_flags():
     class ApprovalFlags:
@@ -370,7 +413,7 @@ def directory(payment_token, auction_house, deployer):
 
 @pytest.fixture
 def auction_house_dual_bid(
-    auction_house_with_auction, payment_token, alice, bob, default_reserve_price, precision
+    auction_house_with_auction, payment_token, alice, bob, default_reserve_price, min_next_bid
 ):
     """
     Deploy the Auction Directory contract.
@@ -382,8 +425,7 @@ def auction_house_dual_bid(
         payment_token.approve(house, 2**256 - 1)
         house.create_bid(auction_id, default_reserve_price)
 
-    min_increment = house.default_min_bid_increment_percentage()
-    bob_bid = default_reserve_price + (default_reserve_price * min_increment // precision)
+    bob_bid = min_next_bid(default_reserve_price)
 
     with boa.env.prank(bob):
         payment_token.approve(house, 2**256 - 1)
@@ -392,7 +434,7 @@ def auction_house_dual_bid(
     return house
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_pool_contract():
     return boa.load_partial("contracts/test/MockPool.vy")
 
@@ -419,10 +461,9 @@ def mock_pool(mock_pool_contract, payment_token, weth, fork_mode):
 
 
 @pytest.fixture
-def mock_trader(payment_token, weth, mock_pool, pool_indices, directory):
+def mock_trader(payment_token, weth, mock_pool, pool_indices, directory, zap_contract):
     """Deploy mock trader that uses mock pool"""
-    contract = boa.load_partial("contracts/AuctionZap.vy")
-    trader = contract.deploy(payment_token, weth, mock_pool.address, pool_indices)
+    trader = zap_contract.deploy(payment_token, weth, mock_pool.address, pool_indices)
     trader.set_approved_directory(directory)
     return trader
 
@@ -432,13 +473,27 @@ def eth_price():
     return 3000
 
 
+@pytest.fixture(scope="session")
+def mock_oracle_contract():
+    return boa.load_partial("contracts/test/MockOracle.vy")
+
+
+@pytest.fixture(scope="session")
+def oracle_contract():
+    return boa.load_partial("contracts/AuctionOracle.vy")
+
+
 @pytest.fixture
-def mock_oracle_pool(eth_price):
-    oracle_contract = boa.load_partial("contracts/test/MockOracle.vy")
-    return oracle_contract.deploy(eth_price * 10**18)
+def mock_oracle_pool(mock_oracle_contract, eth_price):
+    return mock_oracle_contract.deploy(eth_price * 10**18)
 
 
 @pytest.fixture
-def mock_oracle(mock_oracle_pool, mock_pool):
-    oracle_contract = boa.load_partial("contracts/AuctionOracle.vy")
+def mock_oracle(oracle_contract, mock_oracle_pool, mock_pool):
     return oracle_contract.deploy(mock_pool, mock_oracle_pool)
+
+
+@pytest.fixture(scope="session")
+def balance_reader(env):
+    """Read multiple token balances in a single call"""
+    return boa.load_partial("contracts/test/BalanceReader.vy").deploy()
@@ -1,5 +1,4 @@
 import boa
-import pytest
 
 
 def test_bid_accounting_initial_state(
@@ -115,7 +114,7 @@ def test_bid_accounting_insufficient_total(
 
         # Try to bid way more than total available
         large_bid = bob_bid * 2
-        with pytest.raises(Exception):
+        with boa.reverts("external call failed"):
             auction_house_with_auction.create_bid(auction_id, large_bid)
 
         # Verify state unchanged
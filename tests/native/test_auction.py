@@ -1,4 +1,5 @@
 import boa
+import pytest
 
 
 def test_initial_state(
@@ -11,8 +12,6 @@ def test_initial_state(
     default_min_bid_increment,
     default_duration,
     default_fee,
-    precision,
-    auction_struct,
 ):
     """Test the initial state of the auction house after deployment"""
     assert auction_house.owner() == deployer
@@ -27,7 +26,7 @@ def test_initial_state(
     assert auction_house.payment_token() == payment_token.address
 
 
-def test_create_auction(auction_house, deployer, auction_struct):
+def test_create_auction(auction_house, deployer, default_duration, auction_struct):
     """Test auction creation and initial auction state"""
     # Need to create an auction first since it's not automatically created
     with boa.env.prank(deployer):
@@ -40,14 +39,12 @@ def test_create_auction(auction_house, deployer, auction_struct):
     assert auction[auction_struct.auction_id] == 1
     assert auction[auction_struct.amount] == 0
     assert auction[auction_struct.start_time] > 0
-    assert (
-        auction[auction_struct.end_time]
-        == auction[auction_struct.start_time] + auction_house.default_duration()
-    )
+    assert auction[auction_struct.end_time] == auction[auction_struct.start_time] + default_duration
     assert auction[auction_struct.bidder] == "0x0000000000000000000000000000000000000000"
     assert auction[auction_struct.settled] is False
 
 
+@pytest.mark.usefixtures("approve_all")
 def test_create_bid(
     auction_house_with_auction, alice, payment_token, default_reserve_price, auction_struct
 ):
@@ -55,162 +52,134 @@ def test_create_bid(
     house = auction_house_with_auction
     auction_id = house.auction_id()
 
-    # Print initial state
-    print(f"Initial auction state: {house.auction_list(auction_id)}")
-    print(f"Alice address: {alice}")
-
     # Test low bid rejection
     low_bid = default_reserve_price // 2
     with boa.env.prank(alice):
-        payment_token.approve(house.address, low_bid)
         with boa.reverts("!reservePrice"):
             house.create_bid(auction_id, low_bid)
 
     # Make valid bid
     with boa.env.prank(alice):
-        payment_token.approve(house.address, default_reserve_price)
         house.create_bid(auction_id, default_reserve_price)
 
-    # Print post-bid state
     auction = house.auction_list(auction_id)
-    print(f"Post-bid auction state: {auction}")
 
     assert (
         auction[auction_struct.bidder] == alice
-    ), f"Expected bidder to be {alice}, got {auction[4]}"
+    ), f"Expected bidder to be {alice}, got {auction[auction_struct.bidder]}"
     assert (
         auction[auction_struct.amount] == default_reserve_price
-    ), f"Expected amount to be {default_reserve_price}, got {auction[1]}"
+    ), f"Expected amount to be {default_reserve_price}, got {auction[auction_struct.amount]}"
     assert (
         payment_token.balanceOf(house.address) == default_reserve_price
     ), "Expected house to hold tokens"
 
 
+@pytest.mark.usefixtures("approve_all")
 def test_outbid(
     auction_house_with_auction,
     alice,
     bob,
     payment_token,
     default_reserve_price,
-    precision,
+    min_next_bid,
     auction_struct,
 ):
     """Test outbidding functionality"""
     house = auction_house_with_auction
     auction_id = house.auction_id()
 
-    # Print initial state
-    print(f"Initial auction state: {house.auction_list(auction_id)}")
-
     # First bid
     with boa.env.prank(alice):
-        payment_token.approve(house.address, default_reserve_price)
         house.create_bid(auction_id, default_reserve_price)
 
-    first_bid_state = house.auction_list(auction_id)
-    print(f"After first bid: {first_bid_state}")
-
     # Calculate minimum next bid
-    min_next_bid = default_reserve_price + (
-        default_reserve_price * house.default_min_bid_increment_percentage() // precision
-    )
-    print(f"Minimum next bid required: {min_next_bid}")
+    next_bid = min_next_bid(default_reserve_price)
 
     # Try insufficient bid
-    insufficient_bid = min_next_bid - 1
+    insufficient_bid = next_bid - 1
     with boa.env.prank(bob):
-        payment_token.approve(house.address, insufficient_bid)
-        with boa.reverts():
+        with boa.reverts("!increment"):
             house.create_bid(auction_id, insufficient_bid)
 
     # Make successful outbid
     with boa.env.prank(bob):
-        payment_token.approve(house.address, min_next_bid)
-        house.create_bid(auction_id, min_next_bid)
+        house.create_bid(auction_id, next_bid)
 
     # Final state checks
     auction = house.auction_list(auction_id)
-    print(f"Final auction state: {auction}")
-    print(f"Pending returns for alice: {house.pending_returns(alice)}")
+    alice_pending = house.pending_returns(alice)
 
-    assert auction[auction_struct.bidder] == bob, f"Expected bidder to be {bob}, got {auction[4]}"
     assert (
-        auction[auction_struct.amount] == min_next_bid
-    ), f"Expected amount to be {min_next_bid}, got {auction[1]}"
+        auction[auction_struct.bidder] == bob
+    ), f"Expected bidder to be {bob}, got {auction[auction_struct.bidder]}"
+    assert (
+        auction[auction_struct.amount] == next_bid
+    ), f"Expected amount to be {next_bid}, got {auction[auction_struct.amount]}"
     assert (
-        house.pending_returns(alice) == default_reserve_price
+        alice_pending == default_reserve_price
     ), f"Expected alice to have her bid of {default_reserve_price} in pending returns"
     # Contract should hold both the current bid and any pending returns
-    expected_balance = min_next_bid + house.pending_returns(alice)
+    expected_balance = next_bid + alice_pending
     assert (
         payment_token.balanceOf(house.address) == expected_balance
     ), f"Expected house to hold {expected_balance} tokens (current bid + pending returns)"
 
 
-def test_current_auctions(auction_house_with_auction, deployer, auction_struct):
-    """Test that current_auctions only returns currently active auctions"""
-    # Initially should show our first auction as active
-    active_auctions = auction_house_with_auction.current_auctions()
-    assert len(active_auctions) == 1
-    assert active_auctions[0] == 1
+def test_current_auctions_single(auction_house_with_auction):
+    """Test that a freshly created auction is listed as active"""
+    assert auction_house_with_auction.current_auctions() == [1]
+
+
+@pytest.fixture
+def staggered_auctions(auction_house_with_auction, deployer, auction_struct):
+    """
+    Two auctions, the second created 1000 seconds after the first. Returns the
+    house and the timestamps the current_auctions timeline is checked against.
+    """
+    house = auction_house_with_auction
 
     # Move forward a bit to separate the auctions in time
     boa.env.time_travel(seconds=1000)
-
-    # Create a second auction (this will start from current time)
-    with boa.env.prank(deployer):
-        auction_house_with_auction.create_new_auction()
-
-    # Should now show both auctions
-    active_auctions = auction_house_with_auction.current_auctions()
-    print(f"Active auctions after creating second: {active_auctions}")
-    assert len(active_auctions) == 2
-    assert active_auctions[0] == 1
-    assert active_auctions[1] == 2
-
-    # Fast forward to just before first auction ends
-    first_auction = auction_house_with_auction.auction_list(1)
-    second_auction = auction_house_with_auction.auction_list(2)
-    print(f"First auction: start={first_auction[2]}, end={first_auction[3]}")
-    print(f"Second auction: start={second_auction[2]}, end={second_auction[3]}")
-
-    # Travel to 1 second before first auction end
-    time_remaining_first_auction = (
-        int(first_auction[auction_struct.end_time])
-        - (int(first_auction[auction_struct.start_time]) + 1000)
-        - 1
-    )
-    print(f"Time remaining until first auction ends: {time_remaining_first_auction}")
-    boa.env.time_travel(seconds=time_remaining_first_auction)
-
-    # Should still show both auctions
-    active_auctions = auction_house_with_auction.current_auctions()
-    print(f"Active auctions near first end: {active_auctions}")
-    assert len(active_auctions) == 2
-
-    # Move past first auction end
-    boa.env.time_travel(seconds=10)
-
-    # Should only show second auction
-    active_auctions = auction_house_with_auction.current_auctions()
-    print(f"Active auctions after first ends: {active_auctions}")
-    assert len(active_auctions) == 1
-    assert active_auctions[0] == 2
-
-    # Settle the first auction
     with boa.env.prank(deployer):
-        auction_house_with_auction.settle_auction(1)
+        house.create_new_auction()
+
+    first_auction = house.auction_list(1)
+    second_auction = house.auction_list(2)
+    checkpoints = {
+        "second_start": second_auction[auction_struct.start_time],
+        "first_end": first_auction[auction_struct.end_time],
+        "second_end": second_auction[auction_struct.end_time],
+    }
+    return house, checkpoints
+
+
+@pytest.mark.parametrize(
+    "checkpoint,offset,settle_first,expected",
+    [
+        ("second_start", 0, False, [1, 2]),
+        ("first_end", -1, False, [1, 2]),
+        ("first_end", 10, False, [2]),
+        ("first_end", 10, True, [2]),
+        ("second_end", 1, False, []),
+    ],
+    ids=[
+        "both_live_after_second_created",
+        "both_live_before_first_ends",
+        "second_live_after_first_ends",
+        "second_live_after_first_settled",
+        "none_live_after_second_ends",
+    ],
+)
+def test_current_auctions(staggered_auctions, deployer, checkpoint, offset, settle_first, expected):
+    """Test that current_auctions only returns currently active auctions"""
+    house, checkpoints = staggered_auctions
 
-    # Should still only show second auction
-    active_auctions = auction_house_with_auction.current_auctions()
-    assert len(active_auctions) == 1
-    assert active_auctions[0] == 2
+    target = checkpoints[checkpoint] + offset
+    boa.env.time_travel(seconds=target - checkpoints["second_start"])
 
-    # Fast forward past all auctions
-    auction_id = active_auctions[0]
-    expiry_time = auction_house_with_auction.auction_remaining_time(auction_id) + 1
-    boa.env.time_travel(seconds=expiry_time)
+    if settle_first:
+        with boa.env.prank(deployer):
+            house.settle_auction(1)
 
-    # Should show no active auctions
-    active_auctions = auction_house_with_auction.current_auctions()
-    assert len(active_auctions) == 0
+    assert house.current_auctions() == expected
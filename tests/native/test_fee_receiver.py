@@ -50,7 +50,6 @@ def test_fee_collection(
     payment_token,
     default_reserve_price,
     precision,
-    auction_struct,
 ):
     """Test that fees are properly collected during auction settlement"""
     house = auction_house_with_auction
@@ -67,12 +66,8 @@ def test_fee_collection(
         house.create_bid(auction_id, default_reserve_price)
 
     # Fast forward past auction end
-    auction = house.auction_list(auction_id)
-    boa.env.time_travel(
-        seconds=int(auction[auction_struct.end_time])
-        - int(auction[auction_struct.start_time])
-        + 100
-    )
+    expiry_time = house.auction_remaining_time(auction_id) + 1
+    boa.env.time_travel(seconds=expiry_time)
 
     # Record balances before settlement
     fee_receiver = house.fee_receiver()
@@ -104,7 +99,6 @@ def test_zero_fee_settlement(
     alice,
     payment_token,
     default_reserve_price,
-    auction_struct,
 ):
     """Test auction settlement with 0% fee"""
     house = auction_house_with_auction
@@ -120,12 +114,8 @@ def test_zero_fee_settlement(
         house.create_bid(auction_id, default_reserve_price)
 
     # Fast forward past auction end
-    auction = house.auction_list(auction_id)
-    boa.env.time_travel(
-        seconds=int(auction[auction_struct.end_time])
-        - int(auction[auction_struct.start_time])
-        + 100
-    )
+    expiry_time = house.auction_remaining_time(auction_id) + 1
+    boa.env.time_travel(seconds=expiry_time)
 
     # Record balances before settlement
     fee_receiver = house.fee_receiver()
@@ -155,7 +145,6 @@ def test_beneficiary_fee_distribution(
     payment_token,
     default_reserve_price,
     precision,
-    auction_struct,
 ):
     """Test that fees are distributed to custom beneficiary"""
     # Create a custom beneficiary address
@@ -184,12 +173,8 @@ def test_beneficiary_fee_distribution(
         auction_house.create_bid(auction_id, default_reserve_price)
 
     # Fast forward past auction end
-    auction = auction_house.auction_list(auction_id)
-    boa.env.time_travel(
-        seconds=int(auction[auction_struct.end_time])
-        - int(auction[auction_struct.start_time])
-        + 100
-    )
+    expiry_time = auction_house.auction_remaining_time(auction_id) + 1
+    boa.env.time_travel(seconds=expiry_time)
 
     # Record balances before settlement
     fee_receiver = auction_house.fee_receiver()
@@ -1,5 +1,4 @@
 import boa
-import pytest
 
 
 def test_create_auction_without_ipfs(auction_house, deployer, auction_struct):
@@ -116,5 +115,5 @@ def test_invalid_ipfs_hash_length(auction_house, deployer):
 
     with boa.env.prank(deployer):
         # Should revert due to string length
-        with pytest.raises(Exception):
+        with boa.reverts():
             auction_house.create_new_auction(too_long_hash)
@@ -16,7 +16,9 @@ def load_supported_tokens(directory):
     return ret_arr
 
 
-def test_add_token_support(directory, deployer, payment_token, inert_weth, inert_weth_trader):
+def test_add_token_support(
+    directory, deployer, payment_token, inert_weth, inert_weth_trader, erc20_contract
+):
     weth = inert_weth
     weth_trader = inert_weth_trader
 
@@ -34,8 +36,7 @@ def test_add_token_support(directory, deployer, payment_token, inert_weth, inert
         assert tokens_after_first[0] == weth.address
 
         # Try adding a second token
-        test_token_contract = boa.load_partial("contracts/test/ERC20.vy")
-        test_token = test_token_contract.deploy("Test", "TEST", 18)
+        test_token = erc20_contract.deploy("Test", "TEST", 18)
 
         directory.add_token_support(test_token, boa.env.generate_address())
 
@@ -53,16 +54,17 @@ def test_cannot_add_payment_token(directory, payment_token, deployer):
         directory.add_token_support(payment_token, boa.env.generate_address())
 
 
-def test_revoke_token_support(directory, deployer, payment_token, inert_weth, inert_weth_trader):
-    weth_token = boa.load_partial("contracts/test/ERC20.vy").deploy("Wrapped ETH", "WETH", 18)
+def test_revoke_token_support(
+    directory, deployer, payment_token, inert_weth, inert_weth_trader, erc20_contract
+):
+    weth_token = erc20_contract.deploy("Wrapped ETH", "WETH", 18)
     weth_trader = boa.env.generate_address()
 
     with boa.env.prank(deployer):
         # Add multiple tokens
         directory.add_token_support(weth_token, weth_trader)
 
-        test_token_contract = boa.load_partial("contracts/test/ERC20.vy")
-        test_token = test_token_contract.deploy("Test Token", "TEST", 18)
+        test_token = erc20_contract.deploy("Test Token", "TEST", 18)
         directory.add_token_support(test_token, boa.env.generate_address())
 
         # Initial state check
@@ -87,12 +89,14 @@ def test_revoke_token_support(directory, deployer, payment_token, inert_weth, in
         assert len(tokens_after_second_removal) == 0
 
 
-def test_revoke_token_support_order_preservation(directory, deployer, payment_token):
+def test_revoke_token_support_order_preservation(
+    directory, deployer, payment_token, erc20_contract
+):
     with boa.env.prank(deployer):
         # Deploy test tokens
-        weth_token = boa.load_partial("contracts/test/ERC20.vy").deploy("Wrapped ETH", "WETH", 18)
-        test_token_1 = boa.load_partial("contracts/test/ERC20.vy").deploy("Test 1", "TEST1", 18)
-        test_token_2 = boa.load_partial("contracts/test/ERC20.vy").deploy("Test 2", "TEST2", 18)
+        weth_token = erc20_contract.deploy("Wrapped ETH", "WETH", 18)
+        test_token_1 = erc20_contract.deploy("Test 1", "TEST1", 18)
+        test_token_2 = erc20_contract.deploy("Test 2", "TEST2", 18)
 
         # Add tokens
         directory.add_token_support(weth_token, boa.env.generate_address())
@@ -116,21 +120,21 @@ def test_revoke_token_support_order_preservation(directory, deployer, payment_to
         assert tokens_after_removal[1] == test_token_2.address
 
 
-def test_add_token_support_error_handling(directory, deployer, zero_address):
+def test_add_token_support_error_handling(directory, deployer, zero_address, erc20_contract):
     with boa.env.prank(deployer):
         # Attempt to add empty address should revert
         with boa.reverts("!token"):
             directory.add_token_support(zero_address, boa.env.generate_address())
 
         # Attempt to add token without trader should revert
-        test_token = boa.load_partial("contracts/test/ERC20.vy").deploy("Test", "TEST", 18)
+        test_token = erc20_contract.deploy("Test", "TEST", 18)
         with boa.reverts("!trader"):
             directory.add_token_support(test_token, zero_address)
 
 
-def test_revoke_token_support_error_handling(directory, deployer, zero_address):
+def test_revoke_token_support_error_handling(directory, deployer, zero_address, erc20_contract):
     # Attempt to revoke unsupported token should revert
-    test_token = boa.load_partial("contracts/test/ERC20.vy").deploy("Test", "TEST", 18)
+    test_token = erc20_contract.deploy("Test", "TEST", 18)
 
     with boa.env.prank(deployer):
         # Attempt to revoke unsupported token should revert
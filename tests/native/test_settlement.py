@@ -1,4 +1,7 @@
 import boa
+import pytest
+
+pytestmark = pytest.mark.usefixtures("approve_all")
 
 
 def test_withdraw_zero_pending(auction_house_with_auction, alice, payment_token):
@@ -11,7 +14,7 @@ def test_withdraw_zero_pending(auction_house_with_auction, alice, payment_token)
 
 
 def test_withdraw_after_outbid(
-    auction_house_with_auction, alice, bob, payment_token, default_reserve_price, precision
+    auction_house_with_auction, alice, bob, payment_token, default_reserve_price, min_next_bid
 ):
     """Test withdrawing funds after being outbid"""
     auction_id = auction_house_with_auction.auction_id()
@@ -19,16 +22,13 @@ def test_withdraw_after_outbid(
 
     # Calculate bids
     first_bid = default_reserve_price
-    min_increment = auction_house_with_auction.default_min_bid_increment_percentage()
-    second_bid = first_bid + (first_bid * min_increment) // precision
+    second_bid = min_next_bid(first_bid)
 
     with boa.env.prank(alice):
-        payment_token.approve(auction_house_with_auction.address, first_bid)
         auction_house_with_auction.create_bid(auction_id, first_bid)
 
     # Bob outbids
     with boa.env.prank(bob):
-        payment_token.approve(auction_house_with_auction.address, second_bid)
         auction_house_with_auction.create_bid(auction_id, second_bid)
 
     # Alice withdraws
@@ -47,21 +47,20 @@ def test_settle_auction_with_single_bid(
     deployer,
     fee_receiver,
     payment_token,
+    balance_reader,
     default_reserve_price,
-    precision,
-    default_fee,
+    split_fee,
 ):
     """Test settling auction with one bid"""
     auction_id = auction_house_with_auction.auction_id()
     bid_amount = default_reserve_price
 
     # Track balances
-    deployer_balance_before = payment_token.balanceOf(deployer)
-    fee_receiver_balance_before = payment_token.balanceOf(fee_receiver)
+    receivers = [deployer, fee_receiver]
+    balances_before = balance_reader.balances(payment_token, receivers)
 
     # Place and settle bid
     with boa.env.prank(alice):
-        payment_token.approve(auction_house_with_auction.address, bid_amount)
         auction_house_with_auction.create_bid(auction_id, bid_amount)
 
     expiry_time = auction_house_with_auction.auction_remaining_time(auction_id) + 1
@@ -71,36 +70,27 @@ def test_settle_auction_with_single_bid(
         auction_house_with_auction.settle_auction(auction_id)
 
     # Fee is 5% to fee_receiver
-    fee = bid_amount * default_fee // precision
-    owner_amount = bid_amount - fee
+    fee, owner_amount = split_fee(bid_amount)
 
-    assert payment_token.balanceOf(deployer) - deployer_balance_before == owner_amount
-    assert payment_token.balanceOf(fee_receiver) - fee_receiver_balance_before == fee
+    balances_after = balance_reader.balances(payment_token, receivers)
+    assert balances_after == [balances_before[0] + owner_amount, balances_before[1] + fee]
 
 
 def test_settle_auction_no_bids(auction_house_with_auction, deployer, auction_struct):
     """Test settling an auction with no bids"""
     auction_id = auction_house_with_auction.auction_id()
 
-    # Get initial state
-    initial_auction = auction_house_with_auction.auction_list(auction_id)
-    print(f"Initial auction state: {initial_auction}")
-
     # Fast forward past auction end
     expiry_time = auction_house_with_auction.auction_remaining_time(auction_id) + 1
     boa.env.time_travel(seconds=expiry_time)
 
     with boa.env.prank(deployer):
-        # auction_house_with_auction.pause()
         auction_house_with_auction.settle_auction(auction_id)
         auction_house_with_auction.create_new_auction()
 
     # Get final state
     final_auction = auction_house_with_auction.auction_list(auction_id)
     new_auction = auction_house_with_auction.auction_list(auction_id + 1)
-    print(f"Final auction state: {final_auction}")
-    print(f"New auction state: {new_auction}")
-    print(f"New auction ID: {auction_house_with_auction.auction_id()}")
 
     # Verify auction was settled and new one created
     assert auction_house_with_auction.auction_id() == auction_id + 1
@@ -116,29 +106,25 @@ def test_settle_multiple_bids(
     proceeds_receiver,
     payment_token,
     default_reserve_price,
-    precision,
+    min_next_bid,
 ):
     auction_id = auction_house_with_auction.auction_id()
     alice_balance_before = payment_token.balanceOf(alice)
 
     # Place bids
     first_bid = default_reserve_price
-    min_increment = auction_house_with_auction.default_min_bid_increment_percentage()
-    second_bid = first_bid + (first_bid * min_increment) // precision
+    second_bid = min_next_bid(first_bid)
 
     with boa.env.prank(alice):
-        payment_token.approve(auction_house_with_auction.address, first_bid)
         auction_house_with_auction.create_bid(auction_id, first_bid)
 
     with boa.env.prank(bob):
-        payment_token.approve(auction_house_with_auction.address, second_bid)
         auction_house_with_auction.create_bid(auction_id, second_bid)
 
     expiry_time = auction_house_with_auction.auction_remaining_time(auction_id) + 1
     boa.env.time_travel(seconds=expiry_time)
 
     with boa.env.prank(deployer):
-        # auction_house_with_auction.pause()
         auction_house_with_auction.settle_auction(auction_id)
 
     alice_balance_mid = payment_token.balanceOf(alice)
@@ -154,7 +140,6 @@ def test_settle_auction_not_ended(auction_house_with_auction, deployer, auction_
     auction_id = auction_house_with_auction.auction_id()
 
     with boa.env.prank(deployer), boa.reverts("!completed"):
-        # auction_house_with_auction.pause()
         auction_house_with_auction.settle_auction(auction_id)
 
 
@@ -164,7 +149,7 @@ def test_auction_extension(
     bob,
     payment_token,
     default_reserve_price,
-    precision,
+    min_next_bid,
     auction_struct,
 ):
     """Test auction gets extended when bid near end"""
@@ -172,12 +157,10 @@ def test_auction_extension(
 
     # Calculate bid amounts
     first_bid = default_reserve_price
-    min_increment = auction_house_with_auction.default_min_bid_increment_percentage()
-    second_bid = first_bid + (first_bid * min_increment) // precision
+    second_bid = min_next_bid(first_bid)
 
     # Place initial bid
     with boa.env.prank(alice):
-        payment_token.approve(auction_house_with_auction.address, first_bid)
         auction_house_with_auction.create_bid(auction_id, first_bid)
 
     # Move to near end of auction
@@ -189,7 +172,6 @@ def test_auction_extension(
 
     # Place bid near end
     with boa.env.prank(bob):
-        payment_token.approve(auction_house_with_auction.address, second_bid)
         auction_house_with_auction.create_bid(auction_id, second_bid)
 
     # Check auction was extended
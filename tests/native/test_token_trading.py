@@ -127,14 +127,15 @@ def test_mock_unsupported_token(auction_house, payment_token, alice):
             )
 
 
-def test_trading_views_in_directory(directory, payment_token, weth, mock_trader, mock_pool):
+def test_trading_views_in_directory(
+    directory, payment_token, weth, mock_trader, mock_pool, zap_contract
+):
     owner = directory.owner()
     with boa.env.prank(owner):
         directory.add_token_support(weth, mock_trader)
     val = 10**18
     rate = mock_pool.rate() / 10**18
-    trader_contract = boa.load_partial("contracts/AuctionZap.vy")
-    trader = trader_contract.at(directory.supported_token_zaps(weth))
+    trader = zap_contract.at(directory.supported_token_zaps(weth))
     assert trader.get_dy(val) == val * rate
     assert trader.get_dx(val) == val / rate
     assert trader.safe_get_dx(val) == val / rate
@@ -246,7 +247,7 @@ def test_equal_bid_with_token_directory(
     # This should fail with the original code
     with boa.env.prank(alice):
         weth.approve(directory, weth_amount)
-        with pytest.raises(Exception) as excinfo:
+        with boa.reverts("!bid_amount"):
             directory.create_bid_with_token(
                 auction_house_with_auction,
                 auction_id,
@@ -254,7 +255,6 @@ def test_equal_bid_with_token_directory(
                 weth,
                 current_bid,  # Exactly equal to current bid
             )
-        assert "!bid_amount" in str(excinfo.value), "Should fail with !bid_amount"
 
 
 def test_eth_bid_to_amount(